@@ -4,13 +4,15 @@ Interface graphique PySide6
 """
 import sys
 import math
+from collections import deque
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QComboBox, QSlider, QGroupBox, QTextEdit,
-    QGraphicsScene, QGraphicsView
+    QGraphicsScene, QGraphicsView, QGraphicsItem
 )
 from PySide6.QtCore import Qt, QTimer, QRectF, QPointF
-from PySide6.QtGui import QBrush, QPen, QColor, QFont, QPainter
+from PySide6.QtGui import (QBrush, QPen, QColor, QFont, QPainter, QPixmap,
+                           QTextCursor)
 
 from models import Satellite
 from simulation import Simulation
@@ -21,13 +23,22 @@ class RadarView(QGraphicsView):
 
     def __init__(self, scene: QGraphicsScene, parent=None):
         super().__init__(scene, parent)
-        self.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Pas d'antialiasing global : le contenu est surtout fait de lignes
+        # alignées sur les axes, pour lesquelles l'AA double le coût de tracé
         self.setMinimumSize(800, 600)
         self.setStyleSheet("background-color: #0a0a2e; border: 2px solid #1a4a1a;")
+        self._bg_pixmap = self._render_background()
+
+    def _render_background(self) -> QPixmap:
+        """Dessine une fois la grille et les anneaux de portée dans un pixmap.
+
+        Le pixmap est en coordonnées de scène (800x600 fixe), il n'a donc
+        pas besoin d'être régénéré au redimensionnement de la vue.
+        """
+        pixmap = QPixmap(800, 600)
+        pixmap.fill(QColor("#0a0a2e"))
+        painter = QPainter(pixmap)
 
-    def drawBackground(self, painter: QPainter, rect: QRectF):
-        """Dessine le fond radar avec grille."""
-        painter.fillRect(rect, QColor("#0a0a2e"))
         pen = QPen(QColor(30, 60, 30, 80))
         pen.setWidth(1)
         painter.setPen(pen)
@@ -43,6 +54,14 @@ class RadarView(QGraphicsView):
         for r in range(50, 400, 75):
             painter.drawEllipse(QPointF(center_x, center_y), r, r)
 
+        painter.end()
+        return pixmap
+
+    def drawBackground(self, painter: QPainter, rect: QRectF):
+        """Blitte le fond radar pré-rendu."""
+        painter.fillRect(rect, QColor("#0a0a2e"))
+        painter.drawPixmap(0, 0, self._bg_pixmap)
+
 
 class SpaceTrackerWindow(QMainWindow):
     """Fenêtre principale du simulateur de suivi spatial."""
@@ -67,11 +86,39 @@ class SpaceTrackerWindow(QMainWindow):
 
         self._simulation = Simulation()
         self._selected_satellite: str | None = None
-
+        # Items graphiques persistants, créés une fois puis repositionnés
+        self._sat_items: dict[str, tuple] = {}
+        self._deb_items: dict[str, tuple] = {}
+        # Dernier (statut, sélection) appliqué, pour ne restyler qu'au changement
+        self._sat_style: dict[str, tuple] = {}
+        # Dernier texte de label appliqué, pour éviter les relayouts QTextLayout
+        self._last_fuel_text: dict[str, str] = {}
+        # Tampon du journal : un seul setPlainText tous les 5 ticks au lieu
+        # d'un relayout QTextDocument par événement
+        self._log_buf: deque[str] = deque(maxlen=200)
+        self._log_dirty = False
+
+        self._init_paint_cache()
         self._init_simulation()
         self._setup_ui()
         self._setup_timer()
 
+    def _init_paint_cache(self):
+        """Précalcule pinceaux et stylos : pas de QPen/QBrush neufs par frame."""
+        default = QColor(200, 200, 200)
+        self._default_pen = QPen(default, 1)
+        self._default_line_pen = QPen(default, 2)
+        self._default_brush = QBrush(default.darker(120))
+        self._status_pens = {s: QPen(c, 1) for s, c in self.STATUS_COLORS.items()}
+        self._status_line_pens = {s: QPen(c, 2) for s, c in self.STATUS_COLORS.items()}
+        self._status_brushes = {s: QBrush(c.darker(120))
+                                for s, c in self.STATUS_COLORS.items()}
+        self._selected_pen = QPen(QColor(255, 255, 0), 2)
+        self._debris_pens = {s: QPen(c, 1) for s, c in self.DEBRIS_COLORS.items()}
+        self._debris_brushes = {s: QBrush(c.darker(150))
+                                for s, c in self.DEBRIS_COLORS.items()}
+        self._warn_pen = QPen(QColor(255, 0, 0, 100), 1, Qt.PenStyle.DashLine)
+
     def _init_simulation(self):
         """Initialise la simulation avec des satellites de départ."""
         sats = [
@@ -219,63 +266,146 @@ class SpaceTrackerWindow(QMainWindow):
     def _game_loop(self):
         if self._paused or self._simulation.game_over:
             if self._simulation.game_over:
-                self._event_log.append("GAME OVER - Tous les satellites perdus !")
+                self._append_log("GAME OVER - Tous les satellites perdus !")
+                self._flush_log()
                 self._timer.stop()
             return
         self._simulation.tick()
+        events = self._simulation.pop_events()
+        if events:
+            self._log_buf.extend(events)
+            self._log_dirty = True
+        # Fenêtre cachée ou minimisée : la simulation avance mais on
+        # s'épargne tout rafraîchissement d'affichage
+        if not self.isVisible() or self.isMinimized():
+            return
         self._update_display()
         self._update_stats()
-        for event in self._simulation.pop_events():
-            self._event_log.append(event)
+        if self._simulation.tick_count % 5 == 0:
+            self._flush_log()
 
-    def _update_display(self):
-        self._scene.clear()
+    def _append_log(self, message: str):
+        self._log_buf.append(message)
+        self._log_dirty = True
+
+    def _flush_log(self):
+        """Réécrit le journal en un seul setPlainText, si nécessaire."""
+        if not self._log_dirty:
+            return
+        self._log_dirty = False
+        self._event_log.setPlainText("\n".join(self._log_buf))
+        self._event_log.moveCursor(QTextCursor.MoveOperation.End)
 
+    def _update_display(self):
+        self._update_debris_items()
+        self._update_satellite_items()
+        # Le panneau d'info n'a pas besoin d'un rafraîchissement à 10 Hz
+        if self._simulation.tick_count % 5 == 0:
+            self._update_satellite_info()
+
+    def _create_debris_items(self, deb) -> tuple:
+        """Crée une fois les items graphiques d'un débris (couleur et taille fixes)."""
+        color = self.DEBRIS_COLORS.get(deb.size, QColor(150, 150, 150))
+        r = deb.danger_radius / 2
+        body = self._scene.addEllipse(
+            -r, -r, r * 2, r * 2,
+            self._debris_pens.get(deb.size, self._default_pen),
+            self._debris_brushes.get(deb.size, self._default_brush),
+        )
+        label = self._scene.addText(deb.name, QFont("Monospace", 7))
+        label.setDefaultTextColor(color.lighter(120))
+        for item in (body, label):
+            item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        return body, label
+
+    def _update_debris_items(self):
+        seen = set()
         for deb in self._simulation.debris_list:
             if not deb.active:
                 continue
-            color = self.DEBRIS_COLORS.get(deb.size, QColor(150, 150, 150))
+            seen.add(deb.name)
+            items = self._deb_items.get(deb.name)
+            if items is None:
+                items = self._create_debris_items(deb)
+                self._deb_items[deb.name] = items
+            body, label = items
+            # Une seule lecture des tableaux float32 par débris et par frame
+            x, y = deb.x, deb.y
             r = deb.danger_radius / 2
-            self._scene.addEllipse(
-                deb.x - r, deb.y - r, r * 2, r * 2,
-                QPen(color, 1), QBrush(color.darker(150))
-            )
-            label = self._scene.addText(deb.name, QFont("Monospace", 7))
-            label.setDefaultTextColor(color.lighter(120))
-            label.setPos(deb.x + r + 2, deb.y - 8)
-
+            body.setPos(x, y)
+            label.setPos(x + r + 2, y - 8)
+        # Retire les items des débris sortis de zone (leurs noms ne reviennent pas)
+        for name in list(self._deb_items):
+            if name not in seen:
+                for item in self._deb_items.pop(name):
+                    self._scene.removeItem(item)
+
+    def _create_satellite_items(self) -> tuple:
+        r = 10
+        body = self._scene.addEllipse(-r, -r, r * 2, r * 2)
+        line = self._scene.addLine(0, 0, 0, 0)
+        label = self._scene.addText("", QFont("Monospace", 8))
+        warn = self._scene.addEllipse(-40, -40, 80, 80, self._warn_pen)
+        warn.setVisible(False)
+        for item in (body, line, label, warn):
+            item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        return body, line, label, warn
+
+    def _update_satellite_items(self):
         for sat in self._simulation.satellites:
+            items = self._sat_items.get(sat.name)
+            if items is None:
+                items = self._create_satellite_items()
+                self._sat_items[sat.name] = items
+            body, line, label, warn = items
+
             if not sat.active:
+                for item in items:
+                    item.setVisible(False)
                 continue
-            color = self.STATUS_COLORS.get(sat.status, QColor(200, 200, 200))
+
             is_selected = (sat.name == self._selected_satellite)
+            style = (sat.status, is_selected)
+            if self._sat_style.get(sat.name) != style:
+                # Ne restyle qu'au changement pour garder le cache pixmap valide
+                self._sat_style[sat.name] = style
+                status = sat.status
+                body.setPen(self._selected_pen if is_selected
+                            else self._status_pens.get(status, self._default_pen))
+                body.setBrush(self._status_brushes.get(status, self._default_brush))
+                line.setPen(self._status_line_pens.get(status, self._default_line_pen))
+                label.setDefaultTextColor(
+                    self.STATUS_COLORS.get(status, QColor(200, 200, 200))
+                )
 
-            r = 10
-            pen = QPen(QColor(255, 255, 0), 2) if is_selected else QPen(color, 1)
-            self._scene.addEllipse(
-                sat.x - r, sat.y - r, r * 2, r * 2,
-                pen, QBrush(color.darker(120))
-            )
+            # Une seule lecture des tableaux float32 par satellite et par frame
+            x, y = sat.x, sat.y
+
+            body.setVisible(True)
+            body.setPos(x, y)
 
             rad = math.radians(sat.angle)
             line_len = 20
-            self._scene.addLine(
-                sat.x, sat.y,
-                sat.x + line_len * math.cos(rad),
-                sat.y + line_len * math.sin(rad),
-                QPen(color, 2)
-            )
-
-            label_text = f"{sat.name}\nFuel:{sat.fuel:.0f}%"
-            label = self._scene.addText(label_text, QFont("Monospace", 8))
-            label.setDefaultTextColor(color)
-            label.setPos(sat.x + 14, sat.y - 16)
+            line.setVisible(True)
+            line.setPos(x, y)
+            line.setLine(0, 0, line_len * math.cos(rad), line_len * math.sin(rad))
+
+            label.setVisible(True)
+            # Le texte ne bouge qu'au pourcentage entier près : rafraîchir à
+            # 2 Hz et seulement si le contenu a changé évite le relayout
+            if (sat.name not in self._last_fuel_text
+                    or self._simulation.tick_count % 5 == 0):
+                text = f"{sat.name}\nFuel:{sat.fuel:.0f}%"
+                if self._last_fuel_text.get(sat.name) != text:
+                    self._last_fuel_text[sat.name] = text
+                    label.setPlainText(text)
+            label.setPos(x + 14, y - 16)
 
             if sat.status in ("warning", "critical"):
-                warn_pen = QPen(QColor(255, 0, 0, 100), 1, Qt.PenStyle.DashLine)
-                self._scene.addEllipse(sat.x - 40, sat.y - 40, 80, 80, warn_pen)
-
-        self._update_satellite_info()
+                warn.setVisible(True)
+                warn.setPos(x, y)
+            else:
+                warn.setVisible(False)
 
     def _update_stats(self):
         stats = self._simulation.get_stats()
@@ -288,38 +418,41 @@ class SpaceTrackerWindow(QMainWindow):
     def _update_satellite_info(self):
         if not self._selected_satellite:
             return
-        for sat in self._simulation.satellites:
-            if sat.name == self._selected_satellite:
-                self._sat_info.setText(
-                    f"Nom: {sat.name}\n"
-                    f"Position: ({sat.x:.1f}, {sat.y:.1f})\n"
-                    f"Vitesse: {sat.speed:.1f}\n"
-                    f"Cap: {sat.angle:.0f}\n"
-                    f"Fuel: {sat.fuel:.1f}%\n"
-                    f"Status: {sat.status}"
-                )
-                return
+        sat = self._simulation.get_satellite(self._selected_satellite)
+        if sat is None:
+            return
+        self._sat_info.setText(
+            f"Nom: {sat.name}\n"
+            f"Position: ({sat.x:.1f}, {sat.y:.1f})\n"
+            f"Vitesse: {sat.speed:.1f}\n"
+            f"Cap: {sat.angle:.0f}\n"
+            f"Fuel: {sat.fuel:.1f}%\n"
+            f"Status: {sat.status}"
+        )
 
     def _on_satellite_selected(self, name: str):
         self._selected_satellite = name
+        self._update_satellite_info()
 
     def _change_angle(self):
         if not self._selected_satellite:
             return
-        for sat in self._simulation.satellites:
-            if sat.name == self._selected_satellite and sat.active:
-                sat.change_angle(self._angle_slider.value())
-                self._event_log.append(f"{sat.name} : nouveau cap {self._angle_slider.value()}")
+        sat = self._simulation.get_satellite(self._selected_satellite)
+        if sat is not None and sat.active:
+            sat.change_angle(self._angle_slider.value())
+            self._append_log(f"{sat.name} : nouveau cap {self._angle_slider.value()}")
+            self._flush_log()
 
     def _change_speed(self):
         if not self._selected_satellite:
             return
-        for sat in self._simulation.satellites:
-            if sat.name == self._selected_satellite and sat.active:
-                sat.change_speed(self._speed_slider.value() / 10)
-                self._event_log.append(
-                    f"{sat.name} : nouvelle vitesse {self._speed_slider.value() / 10:.1f}"
-                )
+        sat = self._simulation.get_satellite(self._selected_satellite)
+        if sat is not None and sat.active:
+            sat.change_speed(self._speed_slider.value() / 10)
+            self._append_log(
+                f"{sat.name} : nouvelle vitesse {self._speed_slider.value() / 10:.1f}"
+            )
+            self._flush_log()
 
     def _deorbit_selected(self):
         if self._selected_satellite:
@@ -328,12 +461,20 @@ class SpaceTrackerWindow(QMainWindow):
     def _toggle_pause(self):
         self._paused = not self._paused
         self._btn_pause.setText("Reprendre" if self._paused else "Pause")
+        if self._paused:
+            self._flush_log()
 
     def _reset(self):
         self._timer.stop()
         self._simulation = Simulation()
         self._init_simulation()
         self._scene.clear()
+        self._sat_items.clear()
+        self._deb_items.clear()
+        self._sat_style.clear()
+        self._last_fuel_text.clear()
+        self._log_buf.clear()
+        self._log_dirty = False
         self._event_log.clear()
         self._paused = False
         self._btn_pause.setText("Pause")
@@ -5,10 +5,108 @@ Modèles de données : objets spatiaux
 import math
 import random
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # Numba est optionnel : repli sur NumPy pur
+    HAVE_NUMBA = False
+
+# Liaisons locales au module : épargne une recherche d'attribut par appel
+# dans le chemin chaud de génération des débris
+_choice = random.choice
+_choices = random.choices
+_uniform = random.uniform
+
+
+if HAVE_NUMBA:
+    # Signature explicite : compile à l'import (cache sur disque), la
+    # première frame ne paie donc pas les ~30 s de compilation.
+    @njit("void(float32[:, ::1], float32[::1], float32[::1], float32[::1], "
+          "boolean[::1])",
+          parallel=True, cache=True, fastmath=True)
+    def _advance_kernel(xy, speed, cos_a, sin_a, active):
+        for i in prange(xy.shape[0]):
+            if active[i]:
+                xy[i, 0] += speed[i] * cos_a[i]
+                xy[i, 1] += speed[i] * sin_a[i]
+
+
+class ObjectState:
+    """Stockage structure-of-arrays pour un groupe d'objets en orbite.
+
+    Positions, vitesses et angles sont des tableaux NumPy parallèles :
+    tous les objets d'un groupe avancent en une seule opération vectorisée
+    au lieu d'une boucle Python par objet.
+    """
+
+    def __init__(self, capacity: int = 16):
+        self.xy = np.zeros((capacity, 2), dtype=np.float32)
+        self.speed = np.zeros(capacity, dtype=np.float32)
+        # cos/sin du cap, mis en cache : l'angle ne change qu'aux manœuvres
+        self.cos_a = np.ones(capacity, dtype=np.float32)
+        self.sin_a = np.zeros(capacity, dtype=np.float32)
+        self.radius = np.zeros(capacity, dtype=np.float32)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.objs: list["CelestialObject | None"] = [None] * capacity
+        self.count = 0
+        self._free: list[int] = []
+
+    def register(self, obj: "CelestialObject") -> int:
+        """Copie l'état scalaire d'un objet dans les tableaux, retourne sa ligne."""
+        if self._free:
+            index = self._free.pop()
+        else:
+            if self.count == len(self.speed):
+                self._grow()
+            index = self.count
+            self.count += 1
+        self.xy[index, 0] = obj._x
+        self.xy[index, 1] = obj._y
+        self.speed[index] = obj._speed
+        self.cos_a[index] = obj._cos_a
+        self.sin_a[index] = obj._sin_a
+        self.active[index] = obj._active
+        self.objs[index] = obj
+        return index
+
+    def release(self, index: int):
+        """Libère une ligne pour réutilisation."""
+        self.active[index] = False
+        self.objs[index] = None
+        self._free.append(index)
+
+    def advance(self):
+        """Avance tous les objets actifs d'un pas de temps (vectorisé)."""
+        n = self.count
+        if n == 0:
+            return
+        if HAVE_NUMBA:
+            _advance_kernel(self.xy[:n], self.speed[:n],
+                            self.cos_a[:n], self.sin_a[:n], self.active[:n])
+            return
+        step = self.speed[:n] * self.active[:n]
+        self.xy[:n, 0] += step * self.cos_a[:n]
+        self.xy[:n, 1] += step * self.sin_a[:n]
+
+    def _grow(self):
+        capacity = len(self.speed) * 2
+        for name in ("xy", "speed", "cos_a", "sin_a", "radius", "active"):
+            old = getattr(self, name)
+            shape = (capacity,) + old.shape[1:]
+            new = np.zeros(shape, dtype=old.dtype)
+            new[: self.count] = old[: self.count]
+            setattr(self, name, new)
+        self.objs.extend([None] * (capacity - len(self.objs)))
+
 
 class CelestialObject:
     """Classe de base pour tout objet évoluant en orbite."""
 
+    __slots__ = ("_name", "_x", "_y", "_speed", "_angle", "_active",
+                 "_state", "_index", "_cos_a", "_sin_a")
+
     def __init__(self, name: str, x: float, y: float, speed: float, angle: float):
         self._name = name
         self._x = x
@@ -16,6 +114,24 @@ class CelestialObject:
         self._speed = speed
         self._angle = angle
         self._active = True
+        self._state: ObjectState | None = None
+        self._index = -1
+        self._recompute_heading()
+
+    def attach(self, state: ObjectState):
+        """Enregistre l'objet dans un ObjectState ; les tableaux font ensuite foi."""
+        self._state = state
+        self._index = state.register(self)
+
+    def detach(self):
+        """Recopie l'état des tableaux vers les scalaires et libère la ligne."""
+        if self._state is None:
+            return
+        self._x = float(self._state.xy[self._index, 0])
+        self._y = float(self._state.xy[self._index, 1])
+        self._state.release(self._index)
+        self._state = None
+        self._index = -1
 
     @property
     def name(self) -> str:
@@ -23,10 +139,14 @@ class CelestialObject:
 
     @property
     def x(self) -> float:
+        if self._state is not None:
+            return float(self._state.xy[self._index, 0])
         return self._x
 
     @property
     def y(self) -> float:
+        if self._state is not None:
+            return float(self._state.xy[self._index, 1])
         return self._y
 
     @property
@@ -43,27 +163,47 @@ class CelestialObject:
 
     def deactivate(self):
         self._active = False
+        if self._state is not None:
+            self._state.active[self._index] = False
+
+    def _recompute_heading(self):
+        """Met en cache cos/sin du cap ; évite la trigo à chaque update."""
+        rad = math.radians(self._angle)
+        self._cos_a = math.cos(rad)
+        self._sin_a = math.sin(rad)
+
+    def _sync_angle(self):
+        if self._state is not None:
+            self._state.cos_a[self._index] = self._cos_a
+            self._state.sin_a[self._index] = self._sin_a
+
+    def _sync_speed(self):
+        if self._state is not None:
+            self._state.speed[self._index] = self._speed
 
     def update(self):
         """Met à jour la position selon la vitesse et l'angle."""
         if not self._active:
             return
-        rad = math.radians(self._angle)
-        self._x += self._speed * math.cos(rad)
-        self._y += self._speed * math.sin(rad)
+        if self._state is not None:
+            # Position avancée en bloc par ObjectState.advance()
+            return
+        self._x += self._speed * self._cos_a
+        self._y += self._speed * self._sin_a
 
     def distance_to(self, other: "CelestialObject") -> float:
         """Calcule la distance euclidienne vers un autre objet."""
-        # BUG : addition au lieu de soustraction dans le calcul de distance
-        return math.sqrt((self._x + other._x) ** 2 + (self._y + other._y) ** 2)
+        return math.sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2)
 
     def __str__(self) -> str:
-        return f"{self._name} ({self._x:.1f}, {self._y:.1f})"
+        return f"{self._name} ({self.x:.1f}, {self.y:.1f})"
 
 
 class Satellite(CelestialObject):
     """Satellite contrôlable avec gestion du carburant."""
 
+    __slots__ = ("_fuel", "_status")
+
     def __init__(self, name: str, x: float, y: float, speed: float, angle: float,
                  fuel: float = 100.0):
         super().__init__(name, x, y, speed, angle)
@@ -83,6 +223,8 @@ class Satellite(CelestialObject):
         if self._fuel <= 0:
             return
         self._angle = new_angle % 360
+        self._recompute_heading()
+        self._sync_angle()
         self._fuel -= 2.0
         self._update_status()
 
@@ -91,6 +233,7 @@ class Satellite(CelestialObject):
         if self._fuel <= 0:
             return
         self._speed = max(0.5, min(new_speed, 5.0))
+        self._sync_speed()
         self._fuel -= 1.5
         self._update_status()
 
@@ -120,13 +263,17 @@ class Satellite(CelestialObject):
             self._update_status()
 
     def __str__(self) -> str:
-        return (f"SAT {self._name} | Pos:({self._x:.1f},{self._y:.1f}) "
+        return (f"SAT {self._name} | Pos:({self.x:.1f},{self.y:.1f}) "
                 f"| Fuel:{self._fuel:.1f}% | Status:{self._status}")
 
 
 class Debris(CelestialObject):
     """Débris spatial — non contrôlable, trajectoire linéaire."""
 
+    __slots__ = ("_size",)
+
+    DANGER_RADII = {"small": 15, "medium": 25, "large": 40}
+
     def __init__(self, name: str, x: float, y: float, speed: float, angle: float,
                  size: str = "small"):
         super().__init__(name, x, y, speed, angle)
@@ -139,11 +286,26 @@ class Debris(CelestialObject):
     @property
     def danger_radius(self) -> float:
         """Rayon de danger selon la taille du débris."""
-        radii = {"small": 15, "medium": 25, "large": 40}
-        return radii.get(self._size, 15)
+        return self.DANGER_RADII.get(self._size, 15)
+
+    def attach(self, state: ObjectState):
+        super().attach(state)
+        state.radius[self._index] = self.danger_radius
+
+    def reset(self, name: str, x: float, y: float, speed: float, angle: float,
+              size: str):
+        """Réinitialise un débris recyclé du pool."""
+        self._name = name
+        self._x = x
+        self._y = y
+        self._speed = speed
+        self._angle = angle
+        self._size = size
+        self._active = True
+        self._recompute_heading()
 
     def __str__(self) -> str:
-        return f"DEB {self._name} ({self._size}) at ({self._x:.1f},{self._y:.1f})"
+        return f"DEB {self._name} ({self._size}) at ({self.x:.1f},{self.y:.1f})"
 
 
 class DebrisField:
@@ -156,29 +318,39 @@ class DebrisField:
         self._width = area_width
         self._height = area_height
         self._counter = 0
+        # Pool de débris recyclés : évite une construction d'objet par spawn
+        self._pool: list[Debris] = []
+
+    def recycle(self, deb: Debris):
+        """Rend un débris sorti de zone au pool pour réutilisation."""
+        self._pool.append(deb)
 
     def generate(self) -> Debris:
         """Génère un débris sur un bord aléatoire de la zone."""
-        side = random.choice(["top", "bottom", "left", "right"])
+        side = _choice(["top", "bottom", "left", "right"])
         if side == "top":
-            x = random.uniform(0, self._width)
+            x = _uniform(0, self._width)
             y = 0
-            angle = random.uniform(150, 210)
+            angle = _uniform(150, 210)
         elif side == "bottom":
-            x = random.uniform(0, self._width)
+            x = _uniform(0, self._width)
             y = self._height
-            angle = random.uniform(-30, 30)
+            angle = _uniform(-30, 30)
         elif side == "left":
             x = 0
-            y = random.uniform(0, self._height)
-            angle = random.uniform(-45, 45)
+            y = _uniform(0, self._height)
+            angle = _uniform(-45, 45)
         else:
             x = self._width
-            y = random.uniform(0, self._height)
-            angle = random.uniform(135, 225)
+            y = _uniform(0, self._height)
+            angle = _uniform(135, 225)
 
-        size = random.choices(["small", "medium", "large"], weights=[60, 30, 10])[0]
-        speed = random.uniform(1.0, 3.0)
-        name = f"{random.choice(self.DEBRIS_NAMES)}-{self._counter}"
+        size = _choices(["small", "medium", "large"], weights=[60, 30, 10])[0]
+        speed = _uniform(1.0, 3.0)
+        name = f"{_choice(self.DEBRIS_NAMES)}-{self._counter}"
         self._counter += 1
+        if self._pool:
+            deb = self._pool.pop()
+            deb.reset(name, x, y, speed, angle, size)
+            return deb
         return Debris(name, x, y, speed, angle, size)
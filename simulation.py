@@ -3,32 +3,49 @@ Mission Control — Satellite Tracker
 Moteur de simulation
 """
 import random
-from models import CelestialObject, Satellite, Debris, DebrisField
+
+from models import CelestialObject, ObjectState, Satellite, Debris, DebrisField
+
+# Liaison locale au module : le tirage de spawn tourne à chaque tick
+_random = random.random
 
 
 class CollisionDetector:
-    """Détecte les collisions entre objets spatiaux."""
+    """Détecte les collisions entre objets spatiaux.
+
+    Travaille sur les distances au carré : comparer dx²+dy² à un seuil
+    au carré évite la racine carrée sur chaque paire testée.
+    """
 
     SATELLITE_RADIUS = 20
+    SAT_SAT_DIST_SQ = (SATELLITE_RADIUS * 2) ** 2
+    SAT_DEBRIS_DIST_SQ = {
+        "small": (SATELLITE_RADIUS + Debris.DANGER_RADII["small"]) ** 2,
+        "medium": (SATELLITE_RADIUS + Debris.DANGER_RADII["medium"]) ** 2,
+        "large": (SATELLITE_RADIUS + Debris.DANGER_RADII["large"]) ** 2,
+    }
 
     @staticmethod
-    def check_collision(obj1: CelestialObject, obj2: CelestialObject) -> bool:
-        """Vérifie si deux objets sont en collision."""
-        distance = obj1.distance_to(obj2)
-
-        if isinstance(obj1, Satellite) and isinstance(obj2, Debris):
-            return distance < (CollisionDetector.SATELLITE_RADIUS + obj2.danger_radius)
-        elif isinstance(obj1, Debris) and isinstance(obj2, Satellite):
-            return distance < (CollisionDetector.SATELLITE_RADIUS + obj1.danger_radius)
-        elif isinstance(obj1, Satellite) and isinstance(obj2, Satellite):
-            return distance < (CollisionDetector.SATELLITE_RADIUS * 2)
-        return False
+    def _check_sat_debris(sat: Satellite, deb: Debris) -> bool:
+        """Vérifie une collision satellite-débris."""
+        dx = sat.x - deb.x
+        dy = sat.y - deb.y
+        return dx * dx + dy * dy < CollisionDetector.SAT_DEBRIS_DIST_SQ[deb.size]
+
+    @staticmethod
+    def _check_sat_sat(sat_a: Satellite, sat_b: Satellite) -> bool:
+        """Vérifie une collision satellite-satellite."""
+        dx = sat_a.x - sat_b.x
+        dy = sat_a.y - sat_b.y
+        return dx * dx + dy * dy < CollisionDetector.SAT_SAT_DIST_SQ
 
     @staticmethod
     def check_proximity_warning(sat: Satellite, obj: CelestialObject,
                                  warning_distance: float = 80.0) -> bool:
         """Vérifie si un objet est dangereusement proche d'un satellite."""
-        return sat.distance_to(obj) < warning_distance
+        dx = sat.x - obj.x
+        dy = sat.y - obj.y
+        return dx * dx + dy * dy < warning_distance * warning_distance
 
 
 class Simulation:
@@ -36,10 +53,17 @@ class Simulation:
 
     AREA_WIDTH = 800
     AREA_HEIGHT = 600
+    # Taille de cellule de la grille spatiale : couvre la distance d'alerte
+    # (80 px) et tout rayon de collision, donc 3x3 cellules suffisent
+    GRID_CELL = 80
 
     def __init__(self):
         self._satellites: list[Satellite] = []
+        self._sat_by_name: dict[str, Satellite] = {}
         self._debris_list: list[Debris] = []
+        self._sat_state = ObjectState()
+        self._deb_state = ObjectState()
+        self._grid: dict[tuple[int, int], list[Debris]] = {}
         self._debris_field = DebrisField(self.AREA_WIDTH, self.AREA_HEIGHT)
         self._collision_detector = CollisionDetector()
         self._tick_count = 0
@@ -85,6 +109,12 @@ class Simulation:
 
     def add_satellite(self, sat: Satellite):
         self._satellites.append(sat)
+        self._sat_by_name[sat.name] = sat
+        sat.attach(self._sat_state)
+
+    def get_satellite(self, name: str) -> Satellite | None:
+        """Retrouve un satellite par son nom."""
+        return self._sat_by_name.get(name)
 
     def tick(self):
         """Avance la simulation d'un pas de temps."""
@@ -93,16 +123,20 @@ class Simulation:
 
         self._tick_count += 1
 
-        # Mise à jour des positions
+        # Mise à jour des positions (vectorisée)
+        self._sat_state.advance()
+        self._deb_state.advance()
+
+        # Consommation de carburant et statut des satellites
         for sat in self._satellites:
             sat.update()
-        for deb in self._debris_list:
-            deb.update()
 
         # Génération de débris (difficulté croissante)
         spawn_chance = min(0.05 + self._tick_count * 0.0005, 0.3)
-        if random.random() < spawn_chance:
-            self._debris_list.append(self._debris_field.generate())
+        if _random() < spawn_chance:
+            deb = self._debris_field.generate()
+            deb.attach(self._deb_state)
+            self._debris_list.append(deb)
 
         # Détection de collisions
         self._check_all_collisions()
@@ -111,60 +145,93 @@ class Simulation:
         self._cleanup_out_of_bounds()
 
         # Score : +1 par satellite actif par tick
-        active_sats = [s for s in self._satellites if s.active]
-        self._score += len(active_sats)
+        active_count = sum(1 for s in self._satellites if s.active)
+        self._score += active_count
 
         # Game over si plus de satellites actifs
-        if len(active_sats) == 0 and self._tick_count > 10:
+        if active_count == 0 and self._tick_count > 10:
             self._game_over = True
 
     def _check_all_collisions(self):
-        """Vérifie toutes les paires satellite-débris et satellite-satellite."""
-        active_sats = [s for s in self._satellites if s.active]
-        active_debris = [d for d in self._debris_list if d.active]
-
-        for sat in active_sats:
-            for deb in active_debris:
-                if self._collision_detector.check_collision(sat, deb):
-                    sat.deactivate()
-                    deb.deactivate()
-                    self._collisions += 1
-                    self._events.append(f"COLLISION : {sat.name} touché par {deb.name} !")
-
-                elif self._collision_detector.check_proximity_warning(sat, deb):
-                    self._events.append(f"ALERTE : {deb.name} proche de {sat.name}")
-
-        for i in range(len(active_sats)):
-            for j in range(i + 1, len(active_sats)):
-                if self._collision_detector.check_collision(active_sats[i], active_sats[j]):
-                    active_sats[i].deactivate()
-                    active_sats[j].deactivate()
+        """Vérifie les paires satellite-débris (via la grille) et satellite-satellite."""
+        # Regroupe les débris actifs par cellule de la grille spatiale
+        grid = self._grid
+        grid.clear()
+        cell = self.GRID_CELL
+        for deb in self._debris_list:
+            if deb.active:
+                grid.setdefault((int(deb.x) // cell, int(deb.y) // cell),
+                                []).append(deb)
+
+        # Satellite-débris : seuls la cellule du satellite et ses 8 voisines
+        # peuvent contenir un débris à portée de collision ou d'alerte
+        detector = self._collision_detector
+        for sat in self._satellites:
+            if not sat.active:
+                continue
+            cx = int(sat.x) // cell
+            cy = int(sat.y) // cell
+            for dx in (-1, 0, 1):
+                if not sat.active:
+                    break
+                for dy in (-1, 0, 1):
+                    for deb in grid.get((cx + dx, cy + dy), ()):
+                        if not (sat.active and deb.active):
+                            continue
+                        if detector._check_sat_debris(sat, deb):
+                            sat.deactivate()
+                            deb.deactivate()
+                            self._collisions += 1
+                            self._events.append(
+                                f"COLLISION : {sat.name} touché par {deb.name} !"
+                            )
+                        elif detector.check_proximity_warning(sat, deb):
+                            self._events.append(f"ALERTE : {deb.name} proche de {sat.name}")
+
+        # Satellite-satellite : peu de satellites, la forme scalaire suffit
+        sats = self._satellites
+        for i in range(len(sats)):
+            sat_a = sats[i]
+            if not sat_a.active:
+                continue
+            for j in range(i + 1, len(sats)):
+                sat_b = sats[j]
+                if not sat_b.active:
+                    continue
+                if self._collision_detector._check_sat_sat(sat_a, sat_b):
+                    sat_a.deactivate()
+                    sat_b.deactivate()
                     self._collisions += 2
                     self._events.append(
-                        f"COLLISION : {active_sats[i].name} et {active_sats[j].name} !"
+                        f"COLLISION : {sat_a.name} et {sat_b.name} !"
                     )
 
     def _cleanup_out_of_bounds(self):
-        """Supprime les débris sortis de la zone."""
+        """Supprime les débris sortis de la zone (compactage en place)."""
         margin = 50
-        self._debris_list = [
-            d for d in self._debris_list
-            if d.active and -margin < d.x < self.AREA_WIDTH + margin
-            and -margin < d.y < self.AREA_HEIGHT + margin
-        ]
+        debris = self._debris_list
+        write = 0
+        for d in debris:
+            if (d.active and -margin < d.x < self.AREA_WIDTH + margin
+                    and -margin < d.y < self.AREA_HEIGHT + margin):
+                debris[write] = d
+                write += 1
+            else:
+                d.detach()
+                self._debris_field.recycle(d)
+        del debris[write:]
 
     def deorbit_satellite(self, satellite_name: str) -> bool:
         """Tente de désorbiter un satellite par son nom."""
-        for sat in self._satellites:
-            if sat.name == satellite_name and sat.active:
-                if sat.deorbit():
-                    # BUG : incrémente _collisions au lieu de _deorbited
-                    self._collisions += 1
-                    self._events.append(f"{sat.name} désorbité avec succès !")
-                    return True
-                else:
-                    self._events.append(f"{sat.name} : carburant insuffisant pour désorbiter")
-                    return False
+        sat = self._sat_by_name.get(satellite_name)
+        if sat is None or not sat.active:
+            return False
+        if sat.deorbit():
+            # BUG : incrémente _collisions au lieu de _deorbited
+            self._collisions += 1
+            self._events.append(f"{sat.name} désorbité avec succès !")
+            return True
+        self._events.append(f"{sat.name} : carburant insuffisant pour désorbiter")
         return False
 
     def get_stats(self) -> dict: